@@ -19,6 +19,7 @@ from __future__ import annotations
 import argparse
 import json
 import math
+import os
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -63,8 +64,7 @@ def load_run_data(run_dir: Path) -> dict | None:
     result: dict = {}
 
     if grading_path.exists():
-        with open(grading_path) as f:
-            grading = json.load(f)
+        grading = json.loads(grading_path.read_bytes())
         summary = grading.get("summary", {})
         result["pass_rate"] = summary.get("pass_rate", 0.0)
         result["passed"] = summary.get("passed", 0)
@@ -77,8 +77,7 @@ def load_run_data(run_dir: Path) -> dict | None:
         result["total"] = 0
 
     if timing_path.exists():
-        with open(timing_path) as f:
-            timing = json.load(f)
+        timing = json.loads(timing_path.read_bytes())
         result["time_seconds"] = timing.get("total_duration_seconds", 0.0)
         result["tokens"] = timing.get("total_tokens", 0)
     else:
@@ -109,17 +108,20 @@ def aggregate(iteration_dir: Path, skill_name: str) -> dict:
         "without_skill": [],
     }
 
-    eval_id = 0
-    for eval_dir in sorted(iteration_dir.iterdir()):
-        if not eval_dir.is_dir():
-            continue
-        # Skip non-eval directories
-        if eval_dir.name in ("benchmark.json", "benchmark.md"):
-            continue
+    # DirEntry.is_dir() reuses the type from the directory listing, so
+    # non-directories are filtered without a stat per entry.
+    with os.scandir(iteration_dir) as it:
+        eval_entries = sorted(
+            (e for e in it if e.is_dir() and e.name not in ("benchmark.json", "benchmark.md")),
+            key=lambda e: e.name,
+        )
 
+    eval_id = 0
+    for entry in eval_entries:
         eval_id += 1
         eval_ids.append(eval_id)
-        eval_name = eval_dir.name
+        eval_name = entry.name
+        eval_dir = Path(entry.path)
 
         for config in ("with_skill", "without_skill"):
             config_dir = eval_dir / config
@@ -135,14 +137,8 @@ def aggregate(iteration_dir: Path, skill_name: str) -> dict:
                 "eval_name": eval_name,
                 "configuration": config,
                 "run_number": 1,
-                "result": {
-                    "pass_rate": data["pass_rate"],
-                    "passed": data["passed"],
-                    "failed": data["failed"],
-                    "total": data["total"],
-                    "time_seconds": data["time_seconds"],
-                    "tokens": data["tokens"],
-                },
+                # load_run_data already returns exactly the result fields, in order
+                "result": data,
             }
             runs.append(run)
             config_data[config].append(data)
@@ -190,7 +186,7 @@ def aggregate(iteration_dir: Path, skill_name: str) -> dict:
 
     if trigger_results_path.exists():
         try:
-            trigger_data = json.loads(trigger_results_path.read_text())
+            trigger_data = json.loads(trigger_results_path.read_bytes())
             benchmark["trigger_testing"] = {
                 "trigger_rate": trigger_data.get("trigger", {}).get("rate", 0),
                 "trigger_target": trigger_data.get("trigger", {}).get("target", 90),
@@ -12,19 +12,17 @@ Supports .skillconfig file for custom limits (useful for meta-skills).
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from pathlib import Path
-from typing import TypedDict
+from typing import TYPE_CHECKING, TypedDict
 
-# Try to import tiktoken for accurate counting
-try:
+# tiktoken gives accurate counts; it is imported on first use (see
+# _get_encoding), so --help and usage errors do not pay for the import
+if TYPE_CHECKING:
     import tiktoken
 
-    TIKTOKEN_AVAILABLE = True
-except ImportError:
-    TIKTOKEN_AVAILABLE = False
-
 
 class FileTokens(TypedDict):
     """Token count for a single file."""
@@ -92,10 +90,24 @@ def load_skill_config(skill_dir: Path) -> dict:
         return result
 
 
-def count_tokens_tiktoken(text: str) -> int:
+@functools.lru_cache(maxsize=1)
+def _get_encoding() -> tiktoken.Encoding | None:
+    """Import tiktoken and return the cl100k_base encoding, once per process.
+
+    Returns None when tiktoken is missing or fails to import (e.g. a broken
+    install missing its compiled extension), so callers fall back to estimation.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    return tiktoken.get_encoding("cl100k_base")
+
+
+def count_tokens_tiktoken(text: str, encoding: tiktoken.Encoding) -> int:
     """Count tokens using tiktoken (accurate)."""
-    enc = tiktoken.get_encoding("cl100k_base")
-    return len(enc.encode(text))
+    return len(encoding.encode(text))
 
 
 def count_tokens_estimate(text: str) -> int:
@@ -107,8 +119,9 @@ def count_tokens_estimate(text: str) -> int:
 
 def count_tokens(text: str) -> tuple[int, str]:
     """Count tokens with best available method."""
-    if TIKTOKEN_AVAILABLE:
-        return count_tokens_tiktoken(text), "tiktoken"
+    encoding = _get_encoding()
+    if encoding is not None:
+        return count_tokens_tiktoken(text, encoding), "tiktoken"
     else:
         return count_tokens_estimate(text), "estimate"
 
@@ -277,48 +290,52 @@ def analyze_skill(skill_dir: Path, warn_threshold: int = 80) -> TokenReport:
 
 
 def print_report(report: TokenReport) -> None:
-    """Print human-readable token report."""
-    print(f"Token Count Report: {report['skill_name']}")
+    """Print human-readable token report (built up, then written in one call)."""
+    lines = [f"Token Count Report: {report['skill_name']}"]
     if report.get("custom_limits"):
-        print("(Using custom limits from .skillconfig)")
-    print("━" * 50)
-    print()
+        lines.append("(Using custom limits from .skillconfig)")
+    lines.append("━" * 50)
+    lines.append("")
 
     # SKILL.md
-    print("SKILL.md:")
-    print(f"  Tokens: {report['skill_md_tokens']:,} / {DEFAULT_LIMITS['skill_md_tokens']:,}")
-    print(f"  Lines:  {report['skill_md_lines']:,} / {DEFAULT_LIMITS['skill_md_lines']:,}")
-    print()
+    lines.append("SKILL.md:")
+    lines.append(f"  Tokens: {report['skill_md_tokens']:,} / {DEFAULT_LIMITS['skill_md_tokens']:,}")
+    lines.append(f"  Lines:  {report['skill_md_lines']:,} / {DEFAULT_LIMITS['skill_md_lines']:,}")
+    lines.append("")
 
     # References
     if report["ref_files"]:
-        print("References:")
+        lines.append("References:")
         for f in report["ref_files"]:
-            print(f"  {f['path']}: {f['tokens']:,} tokens")
-        print("  ────────────────────────────")
-        print(f"  Total: {report['ref_total_tokens']:,} / {DEFAULT_LIMITS['total_ref_tokens']:,}")
-        print()
+            lines.append(f"  {f['path']}: {f['tokens']:,} tokens")
+        lines.append("  ────────────────────────────")
+        lines.append(
+            f"  Total: {report['ref_total_tokens']:,} / {DEFAULT_LIMITS['total_ref_tokens']:,}"
+        )
+        lines.append("")
 
     # Total
-    print(
+    lines.append(
         f"Total Skill: {report['total_tokens']:,} / {DEFAULT_LIMITS['total_skill_tokens']:,} tokens"
     )
-    print(f"Method: {report['method']}")
-    print()
+    lines.append(f"Method: {report['method']}")
+    lines.append("")
 
     # Warnings
     if report["warnings"]:
-        print("Warnings:")
+        lines.append("Warnings:")
         for w in report["warnings"]:
-            print(f"  ⚠ {w}")
-        print()
+            lines.append(f"  ⚠ {w}")
+        lines.append("")
 
     # Result
-    print("━" * 50)
+    lines.append("━" * 50)
     if report["passed"]:
-        print("✓ PASSED - Within token budget")
+        lines.append("✓ PASSED - Within token budget")
     else:
-        print("✗ FAILED - Exceeds token budget")
+        lines.append("✗ FAILED - Exceeds token budget")
+
+    print("\n".join(lines))
 
 
 def main() -> int:
@@ -23,12 +23,86 @@ Requires: claude CLI for trigger testing (optional — runs in dry-run mode with
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import random
 import re
 import sys
 from pathlib import Path
 
+# Words of 3+ characters are the unit of the keyword-overlap heuristic
+TRIGGER_WORD_RE = re.compile(r"\b\w{3,}\b")
+# Words of 4+ characters are candidate keywords when improving a description
+KEYWORD_RE = re.compile(r"\b\w{4,}\b")
+
+# Frontmatter fields
+FM_NAME_RE = re.compile(r"^name:\s*(.+)$", re.MULTILINE)
+FM_DESCRIPTION_BLOCK_RE = re.compile(r"^description:\s*>-?\n((?:\s+.+\n?)+)", re.MULTILINE)
+FM_DESCRIPTION_RE = re.compile(r"^description:\s*(.+)$", re.MULTILINE)
+
+# Trigger eval generation (verb and noun patterns match lowercased text)
+QUOTED_PHRASE_RE = re.compile(r'"([^"]{3,})"')
+ACTION_VERB_RE = re.compile(
+    r"\b(create|generate|analyze|review|build|check|validate|test|deploy|"
+    r"configure|scan|audit|format|lint|debug|optimize|refactor)\b"
+)
+DOMAIN_NOUN_RE = re.compile(
+    r"\b(code|api|database|auth|security|test|component|module|service|"
+    r"endpoint|function|class|file|config|deployment|server|client)\b"
+)
+
+# Filler words skipped when picking a domain term from a false-positive query
+NON_DOMAIN_WORDS = frozenset(
+    {
+        "help",
+        "please",
+        "want",
+        "need",
+        "would",
+        "could",
+        "should",
+        "write",
+        "make",
+        "create",
+        "this",
+        "that",
+        "with",
+        "from",
+        "what",
+        "does",
+        "have",
+        "some",
+    }
+)
+
+
+@functools.cache
+def trigger_words(text: str) -> frozenset[str]:
+    """Return the lowercased 3+ character words used for trigger overlap.
+
+    Cached because the same eval queries are re-scored on every iteration.
+
+    Args:
+        text: Query or description text
+
+    Returns:
+        Frozen set of lowercased words
+    """
+    return frozenset(TRIGGER_WORD_RE.findall(text.lower()))
+
+
+def would_trigger(desc_words: frozenset[str], query: str) -> bool:
+    """Predict whether a query triggers a description (dry-run heuristic).
+
+    Args:
+        desc_words: Word set of the description (from trigger_words)
+        query: Eval query text
+
+    Returns:
+        True if the query shares at least 2 words with the description
+    """
+    return len(desc_words & trigger_words(query)) >= 2
+
 
 def parse_skill_md(skill_path: Path) -> tuple[str, str]:
     """Extract name and description from SKILL.md frontmatter.
@@ -49,24 +123,24 @@ def parse_skill_md(skill_path: Path) -> tuple[str, str]:
 
     content = skill_md.read_text()
 
-    # Extract frontmatter
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    # Extract frontmatter (fixed delimiters, so plain str.find instead of a DOTALL regex)
+    end = content.find("\n---", 3) if content.startswith("---\n") else -1
+    if end == -1:
         print("ERROR: No frontmatter found in SKILL.md", file=sys.stderr)
         sys.exit(1)
 
-    frontmatter = match.group(1)
+    frontmatter = content[4:end]
 
     # Extract name
-    name_match = re.search(r"^name:\s*(.+)$", frontmatter, re.MULTILINE)
+    name_match = FM_NAME_RE.search(frontmatter)
     name = name_match.group(1).strip().strip("\"'") if name_match else ""
 
     # Extract description (handle multiline YAML)
-    desc_match = re.search(r"^description:\s*>-?\n((?:\s+.+\n?)+)", frontmatter, re.MULTILINE)
+    desc_match = FM_DESCRIPTION_BLOCK_RE.search(frontmatter)
     if desc_match:
         description = " ".join(line.strip() for line in desc_match.group(1).strip().splitlines())
     else:
-        desc_match = re.search(r"^description:\s*(.+)$", frontmatter, re.MULTILINE)
+        desc_match = FM_DESCRIPTION_RE.search(frontmatter)
         description = desc_match.group(1).strip().strip("\"'") if desc_match else ""
 
     return name, description
@@ -86,22 +160,15 @@ def generate_trigger_evals(name: str, description: str) -> list[dict]:
         List of eval dicts with query and should_trigger fields
     """
     # Extract quoted trigger phrases from description
-    quoted = re.findall(r'"([^"]{3,})"', description)
+    quoted = QUOTED_PHRASE_RE.findall(description)
 
     # Extract key action verbs
-    verbs = re.findall(
-        r"\b(create|generate|analyze|review|build|check|validate|test|deploy|"
-        r"configure|scan|audit|format|lint|debug|optimize|refactor)\b",
-        description.lower(),
-    )
+    description_lower = description.lower()
+    verbs = ACTION_VERB_RE.findall(description_lower)
     verbs = list(set(verbs))
 
     # Extract domain nouns
-    nouns = re.findall(
-        r"\b(code|api|database|auth|security|test|component|module|service|"
-        r"endpoint|function|class|file|config|deployment|server|client)\b",
-        description.lower(),
-    )
+    nouns = DOMAIN_NOUN_RE.findall(description_lower)
     nouns = list(set(nouns))
 
     evals: list[dict] = []
@@ -208,22 +275,15 @@ def score_description(description: str, eval_set: list[dict], verbose: bool = Fa
     Returns:
         Accuracy score (0.0 to 1.0)
     """
-    desc_lower = description.lower()
-    desc_words = set(re.findall(r"\b\w{3,}\b", desc_lower))
+    desc_words = trigger_words(description)
 
     correct = 0
     total = len(eval_set)
 
     for ev in eval_set:
-        query_lower = ev["query"].lower()
-        query_words = set(re.findall(r"\b\w{3,}\b", query_lower))
-
         # Heuristic: keyword overlap as proxy for trigger likelihood
-        overlap = len(desc_words & query_words)
-        would_trigger = overlap >= 2
-
         expected = ev["should_trigger"]
-        is_correct = would_trigger == expected
+        is_correct = would_trigger(desc_words, ev["query"]) == expected
 
         if is_correct:
             correct += 1
@@ -266,11 +326,11 @@ def improve_description(
     if missed_triggers:
         new_keywords = set()
         for mt in missed_triggers:
-            words = re.findall(r"\b\w{4,}\b", mt["query"].lower())
+            words = KEYWORD_RE.findall(mt["query"].lower())
             new_keywords.update(words[:2])
 
         # Only add keywords not already present
-        existing = set(re.findall(r"\b\w{4,}\b", improved.lower()))
+        existing = set(KEYWORD_RE.findall(improved.lower()))
         to_add = new_keywords - existing
 
         if to_add:
@@ -290,29 +350,9 @@ def improve_description(
         exclusion_topics = set()
         for fp in false_positives:
             # Extract the domain/topic from the false positive query
-            query_words = re.findall(r"\b\w{4,}\b", fp["query"].lower())
+            query_words = KEYWORD_RE.findall(fp["query"].lower())
             # Filter out common words to find domain-specific terms
-            common = {
-                "help",
-                "please",
-                "want",
-                "need",
-                "would",
-                "could",
-                "should",
-                "write",
-                "make",
-                "create",
-                "this",
-                "that",
-                "with",
-                "from",
-                "what",
-                "does",
-                "have",
-                "some",
-            }
-            domain_words = [w for w in query_words if w not in common]
+            domain_words = [w for w in query_words if w not in NON_DOMAIN_WORDS]
             if domain_words:
                 exclusion_topics.add(domain_words[0])
 
@@ -414,16 +454,10 @@ def main() -> None:
             break
 
         # Find failures on train set
-        desc_lower = current_description.lower()
-        desc_words = set(re.findall(r"\b\w{3,}\b", desc_lower))
-
-        failures = []
-        for ev in train_set:
-            query_words = set(re.findall(r"\b\w{3,}\b", ev["query"].lower()))
-            overlap = len(desc_words & query_words)
-            would_trigger = overlap >= 2
-            if would_trigger != ev["should_trigger"]:
-                failures.append(ev)
+        desc_words = trigger_words(current_description)
+        failures = [
+            ev for ev in train_set if would_trigger(desc_words, ev["query"]) != ev["should_trigger"]
+        ]
 
         if not failures:
             break
@@ -16,6 +16,7 @@ The .skill file can be installed with:
 from __future__ import annotations
 
 import argparse
+import os
 import re
 import sys
 import tarfile
@@ -25,6 +26,13 @@ ALLOWED_EXTENSIONS = {".md", ".sh", ".py", ".json", ".yaml", ".yml", ".txt", ".h
 
 EXCLUDED_DIRS = {"__pycache__", ".git", "node_modules", "eval-workspace", "evals"}
 
+# Frontmatter sits at the top of SKILL.md; reading a bounded prefix avoids
+# decoding the whole body just to find the name field.
+FRONTMATTER_READ_BYTES = 16384
+
+FRONTMATTER_RE = re.compile(rb"^---\s*\n(.*?)\n---", re.DOTALL)
+NAME_RE = re.compile(rb"^name:\s*(.+)$", re.MULTILINE)
+
 
 def extract_name(skill_dir: Path) -> str:
     """Extract skill name from SKILL.md frontmatter.
@@ -35,14 +43,20 @@ def extract_name(skill_dir: Path) -> str:
     Returns:
         Skill name from frontmatter, or directory name as fallback
     """
-    skill_md = skill_dir / "SKILL.md"
-    if not skill_md.exists():
+    try:
+        with open(skill_dir / "SKILL.md", "rb") as f:
+            head = f.read(FRONTMATTER_READ_BYTES)
+    except OSError:
+        return skill_dir.name
+
+    # Editors on Windows may save SKILL.md with a UTF-8 byte order mark
+    frontmatter = FRONTMATTER_RE.match(head.removeprefix(b"\xef\xbb\xbf"))
+    if not frontmatter:
         return skill_dir.name
 
-    content = skill_md.read_text()
-    match = re.search(r"^name:\s*(.+)$", content, re.MULTILINE)
+    match = NAME_RE.search(frontmatter.group(1))
     if match:
-        return match.group(1).strip().strip("\"'")
+        return match.group(1).decode("utf-8", errors="replace").strip().strip("\"'")
     return skill_dir.name
 
 
@@ -60,33 +74,44 @@ def collect_files(skill_dir: Path) -> list[Path]:
     """
     files: list[Path] = []
 
-    for path in sorted(skill_dir.rglob("*")):
-        if not path.is_file():
-            continue
+    for root, dirnames, filenames in os.walk(skill_dir):
+        # Prune excluded and hidden directories so they are never descended into
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS and not d.startswith(".")]
 
-        # Skip excluded directories
-        if any(part in EXCLUDED_DIRS for part in path.parts):
-            continue
+        root_path = Path(root)
+        for filename in filenames:
+            # Skip hidden files
+            if filename.startswith("."):
+                continue
 
-        # Skip files with disallowed extensions
-        if path.suffix and path.suffix not in ALLOWED_EXTENSIONS:
-            continue
+            path = root_path / filename
 
-        # Skip hidden files
-        if any(part.startswith(".") for part in path.relative_to(skill_dir).parts):
-            continue
+            # Skip files with disallowed extensions
+            if path.suffix and path.suffix not in ALLOWED_EXTENSIONS:
+                continue
 
-        files.append(path)
+            if not path.is_file():
+                continue
 
-    return files
+            files.append(path)
 
+    return sorted(files)
 
-def package_skill(skill_dir: Path, output_path: Path | None = None) -> Path:
+
+def package_skill(
+    skill_dir: Path,
+    output_path: Path | None = None,
+    *,
+    name: str | None = None,
+    files: list[Path] | None = None,
+) -> Path:
     """Package a skill directory into a .skill archive.
 
     Args:
         skill_dir: Path to skill directory containing SKILL.md
         output_path: Optional output path (default: <name>.skill in cwd)
+        name: Precomputed skill name (default: extract_name(skill_dir))
+        files: Precomputed file list (default: collect_files(skill_dir))
 
     Returns:
         Path to the created .skill file
@@ -99,8 +124,10 @@ def package_skill(skill_dir: Path, output_path: Path | None = None) -> Path:
         print(f"ERROR: SKILL.md not found in {skill_dir}", file=sys.stderr)
         sys.exit(1)
 
-    name = extract_name(skill_dir)
-    files = collect_files(skill_dir)
+    if name is None:
+        name = extract_name(skill_dir)
+    if files is None:
+        files = collect_files(skill_dir)
 
     if not files:
         print("ERROR: No files to package", file=sys.stderr)
@@ -130,11 +157,12 @@ def main() -> None:
         print(f"ERROR: Not a directory: {args.skill_dir}", file=sys.stderr)
         sys.exit(1)
 
-    output = package_skill(args.skill_dir, args.output)
-
-    # Print summary
+    # Resolve name and files once; the summary below reuses them
     name = extract_name(args.skill_dir)
     files = collect_files(args.skill_dir)
+    output = package_skill(args.skill_dir, args.output, name=name, files=files)
+
+    # Print summary
     size_kb = output.stat().st_size / 1024
 
     print(f"Packaged: {name}")
@@ -5,17 +5,28 @@ Produces a 0-10 weighted score with per-dimension breakdown.
 Zero external dependencies (stdlib + yaml only).
 
 Usage:
-    score-skill.py <skill-directory> [--json] [--verbose]
+    score-skill.py <skill-directory> [--json] [--verbose] [--no-cache]
+    score-skill.py --batch <parent-directory> [--json] [--verbose] [--no-cache]
+
+--batch scores every immediate subdirectory containing a SKILL.md in one
+process, so interpreter startup and pattern compilation are paid once.
+With --json, batch output is JSON Lines (one report per skill).
+
+Reports are cached under $XDG_CACHE_HOME/score-skill (default ~/.cache),
+keyed by SKILL.md content and the mtime/size of the other skill files.
 
 Exit codes:
-    0 - Score >= 7.0 (APPROVE)
-    1 - Score < 7.0 (REVISE/REJECT)
+    0 - Score >= 7.0 (APPROVE); in batch mode, every skill passed
+    1 - Score < 7.0 (REVISE/REJECT); in batch mode, any skill failed
     2 - Usage error
 """
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
+import os
 import re
 import sys
 from dataclasses import dataclass, field
@@ -32,6 +43,16 @@ try:
 except ImportError:
     yaml = None
 
+# Use the libyaml-backed loader when PyYAML was built with it (much faster)
+_YAML_LOADER: type | None = None
+if yaml is not None:
+    _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Errors raised for malformed example blocks (json.JSONDecodeError is a ValueError)
+_EXAMPLE_PARSE_ERRORS: tuple[type[Exception], ...] = (ValueError,)
+if yaml is not None:
+    _EXAMPLE_PARSE_ERRORS += (yaml.YAMLError,)
+
 
 # ---------------------------------------------------------------------------
 # Data structures
@@ -69,49 +90,58 @@ DIMENSION_WEIGHTS = {
     "token_efficiency": 0.15,
 }
 
-VALID_TOOLS = {
-    "Read",
-    "Write",
-    "Edit",
-    "MultiEdit",
-    "Glob",
-    "Grep",
-    "LS",
-    "Bash",
-    "Task",
-    "Agent",
-    "Skill",
-    "WebFetch",
-    "WebSearch",
-    "AskUserQuestion",
-    "TodoWrite",
-    "KillShell",
-    "BashOutput",
-    "NotebookEdit",
-    "Brief",
-    "ToolSearch",
-    "EnterPlanMode",
-    "ExitPlanMode",
-    "EnterWorktree",
-    "ExitWorktree",
-    "LSP",
-    "RemoteTrigger",
-    "CronCreate",
-    "CronDelete",
-    "CronList",
-    "SendMessage",
-}
+VALID_TOOLS = frozenset(
+    {
+        "Read",
+        "Write",
+        "Edit",
+        "MultiEdit",
+        "Glob",
+        "Grep",
+        "LS",
+        "Bash",
+        "Task",
+        "Agent",
+        "Skill",
+        "WebFetch",
+        "WebSearch",
+        "AskUserQuestion",
+        "TodoWrite",
+        "KillShell",
+        "BashOutput",
+        "NotebookEdit",
+        "Brief",
+        "ToolSearch",
+        "EnterPlanMode",
+        "ExitPlanMode",
+        "EnterWorktree",
+        "ExitWorktree",
+        "LSP",
+        "RemoteTrigger",
+        "CronCreate",
+        "CronDelete",
+        "CronList",
+        "SendMessage",
+    }
+)
 
 PLACEHOLDER_PATTERNS = [
-    r"\bTODO\b",
-    r"\bTBD\b",
-    r"\bFIXME\b",
-    r"\bXXX\b",
-    r"\byour\s+\w+\s+here\b",
-    r"\badd\s+content\s+here\b",
-    r"\bplaceholder\b",
-    r"\blorem\s+ipsum\b",
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\bTODO\b",
+        r"\bTBD\b",
+        r"\bFIXME\b",
+        r"\bXXX\b",
+        r"\byour\s+\w+\s+here\b",
+        r"\badd\s+content\s+here\b",
+        r"\bplaceholder\b",
+        r"\blorem\s+ipsum\b",
+    )
 ]
+# Single alternation over every placeholder pattern, used to skip clean lines in one scan
+PLACEHOLDER_ANY_RE = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in PLACEHOLDER_PATTERNS), re.IGNORECASE
+)
 
 GENERIC_PHRASES = [
     "best practices",
@@ -149,35 +179,66 @@ LLM_FAVORITE_WORDS = [
     "world-class",
 ]
 
+# Prose-scan patterns are paired with literals, at least one of which must
+# appear in the lowercased prose for the pattern to match; when none does,
+# the regex is skipped (see count_prefiltered).
 OVER_EXPLANATION_PATTERNS = [
-    # Explaining basic file format concepts Claude already knows
-    r"\b(?:pdf|json|yaml|xml|csv|html|css)\b.{0,30}\b(?:is a|are a|stands for|which is|format that)\b",
-    # Explaining basic programming concepts
-    r"\b(?:function|variable|class|loop|array|string|integer)\b.{0,30}\b(?:is a|are a|which is|refers to)\b",
-    # Explaining what common tools do
-    r"\b(?:git|docker|npm|pip|bash)\b.{0,30}\b(?:is a|are a|tool that|which is)\b",
-    # Verbose introductory filler
-    r"(?:before we begin|before getting started|first and foremost|it is worth noting that)",
-    r"(?:in this skill|this skill will|the purpose of this skill is to)",
+    (re.compile(p, re.IGNORECASE), literals)
+    for p, literals in (
+        # Explaining basic file format concepts Claude already knows
+        (
+            r"\b(?:pdf|json|yaml|xml|csv|html|css)\b.{0,30}\b(?:is a|are a|stands for|which is|format that)\b",
+            ("is a", "are a", "stands for", "which is", "format that"),
+        ),
+        # Explaining basic programming concepts
+        (
+            r"\b(?:function|variable|class|loop|array|string|integer)\b.{0,30}\b(?:is a|are a|which is|refers to)\b",
+            ("is a", "are a", "which is", "refers to"),
+        ),
+        # Explaining what common tools do
+        (
+            r"\b(?:git|docker|npm|pip|bash)\b.{0,30}\b(?:is a|are a|tool that|which is)\b",
+            ("is a", "are a", "tool that", "which is"),
+        ),
+        # Verbose introductory filler
+        (
+            r"(?:before we begin|before getting started|first and foremost|it is worth noting that)",
+            ("before we begin", "before getting started", "first and foremost", "it is worth"),
+        ),
+        (r"(?:in this skill|this skill will|the purpose of this skill is to)", ("this skill",)),
+    )
 ]
 
+# Tuples, not sets, so the reported pair is stable across runs (set order varies by hash seed)
 SYNONYM_GROUPS = [
-    {"endpoint", "url", "route", "path"},
-    {"function", "method", "procedure", "subroutine"},
-    {"directory", "folder", "dir"},
-    {"repository", "repo", "codebase"},
-    {"parameter", "argument", "arg", "param"},
-    {"error", "exception", "fault", "failure"},
+    ("endpoint", "url", "route", "path"),
+    ("function", "method", "procedure", "subroutine"),
+    ("directory", "folder", "dir"),
+    ("repository", "repo", "codebase"),
+    ("parameter", "argument", "arg", "param"),
+    ("error", "exception", "fault", "failure"),
 ]
 
 TIME_SENSITIVE_PATTERNS = [
-    r"\b(?:before|after)\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b",
-    r"\bas\s+of\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b",
-    r"\bas\s+of\s+\d{4}\b",
-    r"\bcurrently\s+in\s+(?:version|v)\s*\d",
-    r"\bsince\s+(?:version|v)\s*\d+\.\d+",
-    r"\bdeprecated\s+(?:in|since|after)\s+\d{4}\b",
-    r"\buntil\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b",
+    (re.compile(p, re.IGNORECASE), literals)
+    for p, literals in (
+        (
+            r"\b(?:before|after)\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b",
+            ("before", "after"),
+        ),
+        (
+            r"\bas\s+of\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b",
+            ("of",),
+        ),
+        (r"\bas\s+of\s+\d{4}\b", ("of",)),
+        (r"\bcurrently\s+in\s+(?:version|v)\s*\d", ("currently",)),
+        (r"\bsince\s+(?:version|v)\s*\d+\.\d+", ("since",)),
+        (r"\bdeprecated\s+(?:in|since|after)\s+\d{4}\b", ("deprecated",)),
+        (
+            r"\buntil\s+(?:january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{4}\b",
+            ("until",),
+        ),
+    )
 ]
 
 KNOWN_CODE_LANGUAGES = {
@@ -215,6 +276,169 @@ KNOWN_CODE_LANGUAGES = {
     "powershell",
 }
 
+# Code block languages checked for undocumented numeric constants
+MAGIC_NUMBER_LANGUAGES = frozenset(
+    {"python", "py", "bash", "sh", "javascript", "js", "typescript", "ts"}
+)
+
+# Token-efficiency bands, checked in order: (exclusive upper bound, deduction,
+# signal, suggestion). A zero-deduction band is reported as a positive signal.
+LINE_COUNT_BANDS: list[tuple[float, float, str, str | None]] = [
+    (30, 4.0, "Too short: {} lines", "Skill needs more content — add sections, examples, details"),
+    (50, 2.0, "Thin content: {} lines", "Consider adding more examples or detail"),
+    (451, 0.0, "Good length: {} lines", None),
+    (501, 1.0, "Approaching limit: {}/500 lines", None),
+    (
+        float("inf"),
+        2.0,
+        "Too long: {} lines (max 500)",
+        "Move detailed content to references/ files",
+    ),
+]
+
+# Anthropic guide: keep SKILL.md under 5,000 words
+WORD_COUNT_BANDS: list[tuple[float, float, str, str | None]] = [
+    (100, 2.0, "Very few prose words: {}", None),
+    (4001, 0.0, "Word count: {}", None),
+    (
+        5001,
+        1.0,
+        "High word count: {} (limit: 5,000)",
+        "Consider being more concise or offloading to references",
+    ),
+    (
+        float("inf"),
+        2.0,
+        "Exceeds Anthropic 5,000-word limit: {} words — causes slow responses and degraded quality",
+        "Move detailed docs to references/ and link to them. "
+        "Keep SKILL.md under 5,000 words per Anthropic guidelines",
+    ),
+]
+
+# ---------------------------------------------------------------------------
+# Compiled patterns (built once at import instead of per call)
+# ---------------------------------------------------------------------------
+
+# Frontmatter fallback parsing (used when PyYAML is unavailable)
+FM_NAME_RE = re.compile(r"^name:\s*(.+)$", re.MULTILINE)
+FM_DESCRIPTION_RE = re.compile(r"^description:\s*(.+)$", re.MULTILINE)
+FM_LIST_ITEM_RE = re.compile(r"^\s+-\s+(\w+)\s*$", re.MULTILINE)
+
+# Markdown structure
+CODE_BLOCK_RE = re.compile(r"^```(\w*)\s*\n(.*?)^```", re.MULTILINE | re.DOTALL)
+HEADING_RE = re.compile(r"^(#{1,6})\s+(.+)$", re.MULTILINE)
+MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
+NUMBERED_ITEM_RE = re.compile(r"^\d+\.\s")
+SENTENCE_SPLIT_RE = re.compile(r"[.!?]+")
+WORD_RE = re.compile(r"\w+")  # maximal \w runs, same count as \b\w+\b
+LOWER_WORD_RE = re.compile(r"\b[a-z]+\b")
+
+# Spec compliance
+NAME_FORMAT_RE = re.compile(r"^[a-z][a-z0-9-]*[a-z0-9]$")
+FIRST_PERSON_RE = re.compile(r"^(i can|i will|i help|i am|i\'m)\b")
+SECOND_PERSON_RE = re.compile(r"^(you can|you will|you should|your)\b")
+QUOTED_PHRASE_RE = re.compile(r'"[^"]{3,}"')
+ANGLE_BRACKET_RE = re.compile(r"[<>]")
+RESERVED_CLAUDE_RE = re.compile(r"(?:^|-)claude(?:-|$)", re.IGNORECASE)
+RESERVED_ANTHROPIC_RE = re.compile(r"(?:^|-)anthropic(?:-|$)", re.IGNORECASE)
+
+TRIGGER_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\buse\s+when\b",
+        r"\buse\s+this\b",
+        r"\bwhen\s+(?:the\s+)?user\b",
+        r"\bwhen\s+working\b",
+        r"\bwhen\s+you\b",
+        r"\btrigger\b",
+        r"\binvoke\b",
+        r"\bactivate\b",
+    )
+]
+
+# Matched against the lowercased description
+WHAT_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"^(?:generates?|creates?|builds?|analyzes?|reviews?|validates?|checks?|processes?|manages?|automates?|deploys?|configures?|monitors?|tests?|formats?|extracts?|transforms?|scans?|detects?|implements?|orchestrates?)\b",
+        r"^(?:autonomous|automated|comprehensive|interactive|production-ready|end-to-end|full|multi-step)\b",
+    )
+]
+
+CAPABILITY_PATTERNS = [
+    re.compile(p, re.IGNORECASE)
+    for p in (
+        r"\bincluding\b",
+        r"\bsupports?\b",
+        r"\bhandles?\b",
+        r"\bcovers?\b",
+        r"\bfollowing\b",
+        r"\bacross\b",
+        r"\bwith\s+(?:proper|full|complete|comprehensive)\b",
+    )
+]
+
+# Matched against the lowercased description
+VAGUE_DESCRIPTION_PATTERNS = [
+    re.compile(p)
+    for p in (
+        r"^helps?\s+with\s+\w+$",
+        r"^does?\s+stuff\b",
+        r"^processes?\s+data$",
+        r"^handles?\s+things\b",
+        r"^a?\s*(?:simple|basic|general)\s+(?:tool|helper|utility)\b",
+    )
+]
+
+
+# Content depth
+SPECIFIC_PATTERNS = [
+    (re.compile(p, re.IGNORECASE), label)
+    for p, label in (
+        (r"\b\d+\s*(?:bytes?|chars?|characters?|lines?|tokens?)\b", "size constraints"),
+        (r"\bRFC\s*\d+\b", "RFC references"),
+        (r"\bv(?:ersion)?\s*\d+\.\d+", "version references"),
+        (r"\b\d+%\b", "percentages"),
+    )
+]
+ULTRATHINK_RE = re.compile(r"\bultrathink\b", re.IGNORECASE)
+MCP_TOOL_MENTION_RE = re.compile(r"\buse\s+(?:the\s+)?(\w+_\w+)\s+tool\b")
+ALTERNATIVES_RE = re.compile(
+    r"\b(?:you can use|use either|choose between|options include)\b.*\bor\b.*\bor\b",
+    re.IGNORECASE,
+)
+
+VAGUE_INSTRUCTION_PATTERNS = [
+    (re.compile(p, re.IGNORECASE), literals)
+    for p, literals in (
+        (r"validate\s+(?:the\s+)?data\s+before\s+proceeding", ("proceeding",)),
+        (
+            r"make\s+sure\s+(?:things|everything|it)\s+(?:is|are)\s+(?:correct|proper|good)",
+            ("make",),
+        ),
+        (
+            r"check\s+(?:that|if)\s+(?:things|everything)\s+(?:is|are)\s+(?:ok|fine|correct)",
+            ("check",),
+        ),
+        (r"ensure\s+(?:proper|correct|good)\s+(?:handling|processing|behavior)", ("ensure",)),
+        (r"handle\s+(?:errors?|exceptions?)\s+(?:properly|correctly|appropriately)", ("handle",)),
+    )
+]
+
+ACTIONABLE_PATTERNS = [
+    (re.compile(p, re.IGNORECASE), label)
+    for p, label in (
+        (r"run\s+[`'\"]", "specific commands"),
+        (r"scripts/\w+\.\w+", "script references"),
+        (r"```\w+\n", "code blocks"),
+        (r"CRITICAL:", "priority markers"),
+    )
+]
+
+# Advanced patterns and examples
+ARGUMENTS_RE = re.compile(r"\$ARGUMENTS|\$ARG_|\$\d+|\$0")
+CONSTANT_ASSIGNMENT_RE = re.compile(r"[A-Z_]{2,}\s*=\s*\d{2,}")
+
 
 # ---------------------------------------------------------------------------
 # Parsing helpers
@@ -242,22 +466,24 @@ def parse_frontmatter(frontmatter_str: str) -> dict:
 
     if yaml is not None:
         try:
-            return yaml.safe_load(frontmatter_str) or {}
+            data = yaml.load(frontmatter_str, Loader=_YAML_LOADER)
         except yaml.YAMLError:
             return {}
+        # A scalar or list document is not a usable mapping of fields
+        return data if isinstance(data, dict) else {}
 
     # Fallback: regex parsing for key fields
     result = {}
-    name_match = re.search(r"^name:\s*(.+)$", frontmatter_str, re.MULTILINE)
+    name_match = FM_NAME_RE.search(frontmatter_str)
     if name_match:
         result["name"] = name_match.group(1).strip().strip("\"'")
 
-    desc_match = re.search(r"^description:\s*(.+)$", frontmatter_str, re.MULTILINE)
+    desc_match = FM_DESCRIPTION_RE.search(frontmatter_str)
     if desc_match:
         result["description"] = desc_match.group(1).strip().strip("\"'")
 
     # Extract allowed-tools or tools list
-    tools_match = re.findall(r"^\s+-\s+(\w+)\s*$", frontmatter_str, re.MULTILINE)
+    tools_match = FM_LIST_ITEM_RE.findall(frontmatter_str)
     if tools_match:
         result["allowed-tools"] = tools_match
 
@@ -267,7 +493,7 @@ def parse_frontmatter(frontmatter_str: str) -> dict:
 def extract_code_blocks(body: str) -> list[dict]:
     """Extract fenced code blocks with language and content."""
     blocks = []
-    for match in re.finditer(r"^```(\w*)\s*\n(.*?)^```", body, re.MULTILINE | re.DOTALL):
+    for match in CODE_BLOCK_RE.finditer(body):
         lang = match.group(1).lower().strip()
         content = match.group(2).strip()
         blocks.append({"language": lang, "content": content, "length": len(content)})
@@ -277,7 +503,7 @@ def extract_code_blocks(body: str) -> list[dict]:
 def extract_headings(body: str) -> list[tuple[int, str]]:
     """Extract markdown headings with level and text."""
     headings = []
-    for match in re.finditer(r"^(#{1,6})\s+(.+)$", body, re.MULTILINE):
+    for match in HEADING_RE.finditer(body):
         level = len(match.group(1))
         text = match.group(2).strip()
         headings.append((level, text))
@@ -286,8 +512,11 @@ def extract_headings(body: str) -> list[tuple[int, str]]:
 
 def extract_markdown_links(body: str) -> list[str]:
     """Extract relative file paths from markdown links like [text](path.md)."""
+    # Every link contains "](" literally; link-free files skip the regex scan
+    if "](" not in body:
+        return []
     links = []
-    for match in re.finditer(r"\[([^\]]*)\]\(([^)]+)\)", body):
+    for match in MARKDOWN_LINK_RE.finditer(body):
         path = match.group(2).strip()
         # Skip URLs and anchors
         if path.startswith(("http://", "https://", "#", "mailto:")):
@@ -296,9 +525,13 @@ def extract_markdown_links(body: str) -> list[str]:
     return links
 
 
+@functools.lru_cache(maxsize=4)
 def strip_code_blocks(body: str) -> str:
-    """Remove fenced code blocks from content for prose analysis."""
-    return re.sub(r"^```\w*\s*\n.*?^```", "", body, flags=re.MULTILINE | re.DOTALL)
+    """Remove fenced code blocks from content for prose analysis.
+
+    Cached because every prose metric for a skill strips the same body.
+    """
+    return CODE_BLOCK_RE.sub("", body)
 
 
 def count_sentences(text: str) -> int:
@@ -316,30 +549,52 @@ def count_sentences(text: str) -> int:
             continue
         if stripped.startswith(("- [", "- |", "|")):
             continue
-        if re.match(r"^\d+\.\s", stripped) and len(stripped) < 80:
+        if NUMBERED_ITEM_RE.match(stripped) and len(stripped) < 80:
             continue
         prose_lines.append(stripped)
     joined = " ".join(prose_lines)
-    sentences = re.split(r"[.!?]+", joined)
-    return len([s for s in sentences if len(s.strip().split()) >= 3])
+    sentences = SENTENCE_SPLIT_RE.split(joined)
+    return sum(1 for s in sentences if len(s.split()) >= 3)
 
 
 def word_count_prose(text: str) -> int:
     """Count words in prose (excluding code blocks)."""
-    prose = strip_code_blocks(text)
-    words = re.findall(r"\b\w+\b", prose)
-    return len(words)
+    return len(WORD_RE.findall(strip_code_blocks(text)))
 
 
 def type_token_ratio(text: str) -> float:
     """Calculate vocabulary diversity (unique words / total words)."""
     prose = strip_code_blocks(text)
-    words = [w.lower() for w in re.findall(r"\b[a-z]+\b", prose)]
+    words = LOWER_WORD_RE.findall(prose)  # already lowercase-only
     if len(words) < 10:
         return 0.0
     return len(set(words)) / len(words)
 
 
+def count_prefiltered(patterns: list[tuple[re.Pattern[str], tuple[str, ...]]], text: str) -> int:
+    """Total matches of patterns in lowercased text, skipping those whose literals are absent."""
+    return sum(
+        len(pattern.findall(text))
+        for pattern, literals in patterns
+        if any(literal in text for literal in literals)
+    )
+
+
+def count_markdown_files(directory: Path | str) -> int:
+    """Count *.md entries under directory, recursively, using os.scandir."""
+    count = 0
+    try:
+        with os.scandir(directory) as it:
+            for entry in it:
+                if entry.name.endswith(".md"):
+                    count += 1
+                if entry.is_dir(follow_symlinks=False):
+                    count += count_markdown_files(entry.path)
+    except OSError:
+        pass
+    return count
+
+
 # ---------------------------------------------------------------------------
 # Dimension scorers
 # ---------------------------------------------------------------------------
@@ -365,7 +620,7 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
         dim.signals_negative.append("Missing name field")
         dim.suggestions.append("Add name field to frontmatter")
     else:
-        if not re.match(r"^[a-z][a-z0-9-]*[a-z0-9]$", name):
+        if not NAME_FORMAT_RE.match(name):
             dim.score -= 2.0
             dim.signals_negative.append(f"Invalid name format: {name}")
             dim.suggestions.append(
@@ -398,8 +653,8 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
 
         # Check third-person form (Anthropic best practice: always write in third person)
         desc_lower = desc.strip().lower()
-        first_person = re.match(r"^(i can|i will|i help|i am|i\'m)\b", desc_lower)
-        second_person = re.match(r"^(you can|you will|you should|your)\b", desc_lower)
+        first_person = FIRST_PERSON_RE.match(desc_lower)
+        second_person = SECOND_PERSON_RE.match(desc_lower)
         if first_person:
             dim.score -= 1.5
             dim.signals_negative.append("Description uses first person (starts with 'I ...')")
@@ -414,17 +669,7 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
             )
 
         # Check for trigger context (description should say WHEN to use, not just WHAT)
-        trigger_patterns = [
-            r"\buse\s+when\b",
-            r"\buse\s+this\b",
-            r"\bwhen\s+(?:the\s+)?user\b",
-            r"\bwhen\s+working\b",
-            r"\bwhen\s+you\b",
-            r"\btrigger\b",
-            r"\binvoke\b",
-            r"\bactivate\b",
-        ]
-        has_trigger = any(re.search(p, desc, re.IGNORECASE) for p in trigger_patterns)
+        has_trigger = any(p.search(desc) for p in TRIGGER_PATTERNS)
         if has_trigger:
             dim.signals_positive.append("Description includes trigger context (when to use)")
         elif len(desc) >= 20:
@@ -439,9 +684,7 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
         if len(desc) > 250:
             first_250 = desc[:250].lower()
             # Check if the trigger context is in the first 250 chars
-            has_trigger_early = any(
-                re.search(p, first_250, re.IGNORECASE) for p in trigger_patterns
-            )
+            has_trigger_early = any(p.search(first_250) for p in TRIGGER_PATTERNS)
             if has_trigger_early:
                 dim.signals_positive.append("Key use case front-loaded in first 250 chars")
             else:
@@ -455,20 +698,19 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
 
         # Check for quoted trigger phrases (Claude Code best practice)
         # e.g., 'when the user asks to "create a hook", "validate tool use"'
-        quoted_triggers = re.findall(r'"[^"]{3,}"', desc)
+        quoted_triggers = QUOTED_PHRASE_RE.findall(desc)
         if quoted_triggers:
             dim.signals_positive.append(
                 f"Description includes {len(quoted_triggers)} quoted trigger phrase(s)"
             )
             # Bonus: check if quoted triggers are in first 250 chars
-            if len(desc) > 250:
-                early_quoted = re.findall(r'"[^"]{3,}"', desc[:250])
-                if not early_quoted:
-                    dim.score -= 0.2
-                    dim.signals_negative.append("Quoted trigger phrases not in first 250 chars")
-                    dim.suggestions.append(
-                        'Move quoted trigger phrases (e.g., "create X") to the start of description'
-                    )
+            # (only existence matters, so search stops at the first match)
+            if len(desc) > 250 and not QUOTED_PHRASE_RE.search(desc, 0, 250):
+                dim.score -= 0.2
+                dim.signals_negative.append("Quoted trigger phrases not in first 250 chars")
+                dim.suggestions.append(
+                    'Move quoted trigger phrases (e.g., "create X") to the start of description'
+                )
         elif len(desc) >= 50:
             dim.suggestions.append(
                 'Add quoted trigger phrases: \'Use when the user asks to "create X", "configure Y"\''
@@ -481,23 +723,10 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
         has_capabilities = False  # Key capabilities or scope indicators
 
         # WHAT: description starts with an action verb or capability statement
-        what_patterns = [
-            r"^(?:generates?|creates?|builds?|analyzes?|reviews?|validates?|checks?|processes?|manages?|automates?|deploys?|configures?|monitors?|tests?|formats?|extracts?|transforms?|scans?|detects?|implements?|orchestrates?)\b",
-            r"^(?:autonomous|automated|comprehensive|interactive|production-ready|end-to-end|full|multi-step)\b",
-        ]
-        has_what = any(re.search(p, desc_lower) for p in what_patterns)
+        has_what = any(p.search(desc_lower) for p in WHAT_PATTERNS)
 
         # CAPABILITIES: description mentions specific capabilities beyond the intro
-        capability_indicators = [
-            r"\bincluding\b",
-            r"\bsupports?\b",
-            r"\bhandles?\b",
-            r"\bcovers?\b",
-            r"\bfollowing\b",
-            r"\bacross\b",
-            r"\bwith\s+(?:proper|full|complete|comprehensive)\b",
-        ]
-        has_capabilities = any(re.search(p, desc, re.IGNORECASE) for p in capability_indicators)
+        has_capabilities = any(p.search(desc) for p in CAPABILITY_PATTERNS)
 
         # Score the 3-part structure
         parts_present = sum([has_what, has_when, has_capabilities])
@@ -527,7 +756,7 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
             )
 
         # Check for XML angle brackets in description (security)
-        if re.search(r"[<>]", desc):
+        if ANGLE_BRACKET_RE.search(desc):
             dim.score -= 1.0
             dim.signals_negative.append(
                 "Description contains XML angle brackets (< or >) — forbidden for security"
@@ -537,13 +766,13 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
             )
 
         # Check for reserved name segments
-        if name and re.search(r"(?:^|-)claude(?:-|$)", name, re.IGNORECASE):
+        if name and RESERVED_CLAUDE_RE.search(name):
             dim.score -= 1.0
             dim.signals_negative.append("Name contains reserved word 'claude'")
             dim.suggestions.append(
                 "Remove 'claude' from skill name — reserved for official Anthropic skills"
             )
-        if name and re.search(r"(?:^|-)anthropic(?:-|$)", name, re.IGNORECASE):
+        if name and RESERVED_ANTHROPIC_RE.search(name):
             dim.score -= 1.0
             dim.signals_negative.append("Name contains reserved word 'anthropic'")
             dim.suggestions.append(
@@ -551,14 +780,7 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
             )
 
         # Check for vague descriptions
-        vague_patterns = [
-            r"^helps?\s+with\s+\w+$",
-            r"^does?\s+stuff\b",
-            r"^processes?\s+data$",
-            r"^handles?\s+things\b",
-            r"^a?\s*(?:simple|basic|general)\s+(?:tool|helper|utility)\b",
-        ]
-        is_vague = any(re.search(p, desc_lower) for p in vague_patterns)
+        is_vague = any(p.search(desc_lower) for p in VAGUE_DESCRIPTION_PATTERNS)
         if is_vague:
             dim.score -= 1.0
             dim.signals_negative.append("Description is too vague")
@@ -606,12 +828,13 @@ def score_spec_compliance(frontmatter: dict) -> DimensionScore:
     # Check tools
     tools = frontmatter.get("allowed-tools", frontmatter.get("tools", []))
     if tools:
-        invalid = [t for t in tools if t not in VALID_TOOLS]
-        if invalid:
+        # Subset check covers the common all-valid case without building a list
+        if VALID_TOOLS.issuperset(tools):
+            dim.signals_positive.append(f"Valid tools: {len(tools)} declared")
+        else:
+            invalid = [t for t in tools if t not in VALID_TOOLS]
             dim.score -= 1.0
             dim.signals_negative.append(f"Invalid tools: {', '.join(invalid)}")
-        else:
-            dim.signals_positive.append(f"Valid tools: {len(tools)} declared")
 
     dim.score = max(0.0, dim.score)
     return dim
@@ -632,8 +855,10 @@ def score_content_depth(body: str) -> DimensionScore:
         line_lower = line.strip().lower()
         if any(neg in line_lower for neg in negation_words):
             continue
+        if not PLACEHOLDER_ANY_RE.search(line_lower):
+            continue
         for pattern in PLACEHOLDER_PATTERNS:
-            matches = re.findall(pattern, line_lower, re.IGNORECASE)
+            matches = pattern.findall(line_lower)
             placeholder_count += len(matches)
 
     if placeholder_count > 0:
@@ -691,24 +916,16 @@ def score_content_depth(body: str) -> DimensionScore:
             dim.signals_positive.append(f"Good vocabulary diversity: {ttr:.2f}")
 
     # Positive: specific numbers, tool names, version refs
-    specific_patterns = [
-        (r"\b\d+\s*(?:bytes?|chars?|characters?|lines?|tokens?)\b", "size constraints"),
-        (r"\bRFC\s*\d+\b", "RFC references"),
-        (r"\bv(?:ersion)?\s*\d+\.\d+", "version references"),
-        (r"\b\d+%\b", "percentages"),
-    ]
-    for pattern, label in specific_patterns:
-        if re.search(pattern, body, re.IGNORECASE):
+    for pattern, label in SPECIFIC_PATTERNS:
+        if pattern.search(body):
             dim.signals_positive.append(f"Contains {label}")
 
     # Positive: ultrathink keyword enables extended thinking for complex skills
-    if re.search(r"\bultrathink\b", body, re.IGNORECASE):
+    if ULTRATHINK_RE.search(body):
         dim.signals_positive.append("Contains 'ultrathink' for extended thinking")
 
     # Check for over-explanation of concepts Claude already knows
-    overexplain_count = 0
-    for pattern in OVER_EXPLANATION_PATTERNS:
-        overexplain_count += len(re.findall(pattern, prose, re.IGNORECASE))
+    overexplain_count = count_prefiltered(OVER_EXPLANATION_PATTERNS, prose)
 
     if overexplain_count >= 3:
         dim.score -= 1.5
@@ -723,9 +940,7 @@ def score_content_depth(body: str) -> DimensionScore:
         )
 
     # Check for time-sensitive content that will become stale
-    time_sensitive_count = 0
-    for pattern in TIME_SENSITIVE_PATTERNS:
-        time_sensitive_count += len(re.findall(pattern, prose, re.IGNORECASE))
+    time_sensitive_count = count_prefiltered(TIME_SENSITIVE_PATTERNS, prose)
 
     if time_sensitive_count > 0:
         dim.score -= min(time_sensitive_count * 0.5, 1.5)
@@ -738,11 +953,14 @@ def score_content_depth(body: str) -> DimensionScore:
 
     # Check terminology consistency (multiple synonyms from the same group)
     inconsistent_groups: list[tuple[str, str]] = []
-    words_in_prose = set(re.findall(r"\b[a-z]+\b", prose))
+    words_in_prose = set(LOWER_WORD_RE.findall(prose))
     for group in SYNONYM_GROUPS:
         found = [term for term in group if term in words_in_prose]
         if len(found) >= 2:
             inconsistent_groups.append((found[0], found[1]))
+            # Two groups already trigger the full penalty and fill the example list
+            if len(inconsistent_groups) == 2:
+                break
 
     if len(inconsistent_groups) >= 2:
         examples = [f"{a}/{b}" for a, b in inconsistent_groups[:2]]
@@ -756,7 +974,7 @@ def score_content_depth(body: str) -> DimensionScore:
 
     # Check for unqualified MCP tool references (should be ServerName:tool_name)
     # Look for patterns like "use the bigquery_schema tool" without "ServerName:" prefix
-    mcp_mentions = re.findall(r"\buse\s+(?:the\s+)?(\w+_\w+)\s+tool\b", prose)
+    mcp_mentions = MCP_TOOL_MENTION_RE.findall(prose)
     unqualified = [m for m in mcp_mentions if ":" not in m]
     if unqualified:
         dim.score -= 0.5
@@ -766,10 +984,7 @@ def score_content_depth(body: str) -> DimensionScore:
         )
 
     # Check for too many alternatives without a clear default
-    alternatives_pattern = (
-        r"\b(?:you can use|use either|choose between|options include)\b.*\bor\b.*\bor\b"
-    )
-    alt_matches = re.findall(alternatives_pattern, prose, re.IGNORECASE)
+    alt_matches = ALTERNATIVES_RE.findall(prose)
     if alt_matches:
         dim.score -= 0.5
         dim.signals_negative.append(
@@ -782,16 +997,7 @@ def score_content_depth(body: str) -> DimensionScore:
     # Check instruction actionability (Anthropic: specific > vague)
     # Vague: "Validate the data before proceeding" / "Make sure things are correct"
     # Good: "Run `python scripts/validate.py --input {file}` to check data format"
-    vague_instruction_patterns = [
-        r"validate\s+(?:the\s+)?data\s+before\s+proceeding",
-        r"make\s+sure\s+(?:things|everything|it)\s+(?:is|are)\s+(?:correct|proper|good)",
-        r"check\s+(?:that|if)\s+(?:things|everything)\s+(?:is|are)\s+(?:ok|fine|correct)",
-        r"ensure\s+(?:proper|correct|good)\s+(?:handling|processing|behavior)",
-        r"handle\s+(?:errors?|exceptions?)\s+(?:properly|correctly|appropriately)",
-    ]
-    vague_count = 0
-    for pattern in vague_instruction_patterns:
-        vague_count += len(re.findall(pattern, prose, re.IGNORECASE))
+    vague_count = count_prefiltered(VAGUE_INSTRUCTION_PATTERNS, prose)
 
     if vague_count >= 3:
         dim.score -= 1.5
@@ -807,16 +1013,7 @@ def score_content_depth(body: str) -> DimensionScore:
         dim.signals_negative.append(f"Some vague instructions ({vague_count} instance(s))")
 
     # Positive: specific actionable instructions (commands, file paths, code)
-    actionable_patterns = [
-        (r"run\s+[`'\"]", "specific commands"),
-        (r"scripts/\w+\.\w+", "script references"),
-        (r"```\w+\n", "code blocks"),
-        (r"CRITICAL:", "priority markers"),
-    ]
-    actionable_count = 0
-    for pattern, _label in actionable_patterns:
-        if re.search(pattern, body, re.IGNORECASE):
-            actionable_count += 1
+    actionable_count = sum(1 for pattern, _ in ACTIONABLE_PATTERNS if pattern.search(body))
 
     if actionable_count >= 3:
         dim.signals_positive.append("Highly actionable instructions (commands, scripts, code)")
@@ -865,7 +1062,7 @@ def apply_advanced_pattern_bonuses(dim: DimensionScore, frontmatter: dict, body:
         dim.signals_positive.append("Declares argument-hint for autocomplete UX")
 
     # Consistency: argument-hint vs $ARGUMENTS usage
-    uses_arguments = bool(re.search(r"\$ARGUMENTS|\$ARG_|\$\d+|\$0", body))
+    uses_arguments = bool(ARGUMENTS_RE.search(body))
     if has_arg_hint and not uses_arguments:
         dim.signals_negative.append(
             "argument-hint declared but no $ARGUMENTS/$ARG_ placeholder in body"
@@ -951,9 +1148,9 @@ def score_example_quality(body: str) -> DimensionScore:
                 if block["language"] == "json":
                     json.loads(block["content"])
                 elif yaml is not None:
-                    yaml.safe_load(block["content"])
+                    yaml.load(block["content"], Loader=_YAML_LOADER)
                 dim.signals_positive.append(f"Valid {block['language']} example")
-            except Exception:
+            except _EXAMPLE_PARSE_ERRORS:
                 dim.score -= 0.5
                 dim.signals_negative.append(f"Invalid {block['language']} syntax in code block")
                 dim.suggestions.append(f"Fix {block['language']} syntax error in code example")
@@ -961,23 +1158,18 @@ def score_example_quality(body: str) -> DimensionScore:
     # Check for magic numbers in code blocks (unexplained constants)
     magic_count = 0
     for block in blocks:
-        if block["language"] in (
-            "python",
-            "py",
-            "bash",
-            "sh",
-            "javascript",
-            "js",
-            "typescript",
-            "ts",
-        ):
-            # Find assignments like TIMEOUT=47, RETRIES=5, MAX_ITEMS = 100
-            assignments = re.findall(r"[A-Z_]{2,}\s*=\s*\d{2,}", block["content"])
-            for assignment in assignments:
-                # Check if the line has a comment explaining the value
-                for line in block["content"].splitlines():
-                    if assignment in line and "#" not in line and "//" not in line:
-                        magic_count += 1
+        if block["language"] not in MAGIC_NUMBER_LANGUAGES:
+            continue
+        # Find assignments like TIMEOUT=47, RETRIES=5, MAX_ITEMS = 100
+        assignments = CONSTANT_ASSIGNMENT_RE.findall(block["content"])
+        if not assignments:
+            continue
+        # Lines without a comment explaining the value, split once per block
+        bare_lines = [
+            line for line in block["content"].splitlines() if "#" not in line and "//" not in line
+        ]
+        for assignment in assignments:
+            magic_count += sum(1 for line in bare_lines if assignment in line)
 
     if magic_count >= 2:
         dim.score -= 1.0
@@ -1065,6 +1257,8 @@ def _check_progressive_disclosure(body: str, skill_dir: Path, dim: DimensionScor
     # Check for nested references (files that SKILL.md links to should not link to more files)
     nested_count = 0
     nested_files: list[str] = []
+    # Readable linked files, read once and shared with the TOC check below
+    ref_contents: dict[str, str] = {}
     for link in skill_links:
         ref_path = skill_dir / link
         if not ref_path.is_file():
@@ -1073,6 +1267,7 @@ def _check_progressive_disclosure(body: str, skill_dir: Path, dim: DimensionScor
             ref_content = ref_path.read_text()
         except (OSError, UnicodeDecodeError):
             continue
+        ref_contents[link] = ref_content
         ref_links = extract_markdown_links(ref_content)
         # Filter to relative file links that exist in the skill directory
         nested_refs = [rl for rl in ref_links if (skill_dir / rl).is_file()]
@@ -1094,12 +1289,8 @@ def _check_progressive_disclosure(body: str, skill_dir: Path, dim: DimensionScor
     # Check that reference files >100 lines have a table of contents
     missing_toc: list[str] = []
     for link in skill_links:
-        ref_path = skill_dir / link
-        if not ref_path.is_file() or ref_path.suffix != ".md":
-            continue
-        try:
-            ref_content = ref_path.read_text()
-        except (OSError, UnicodeDecodeError):
+        ref_content = ref_contents.get(link)
+        if ref_content is None or (skill_dir / link).suffix != ".md":
             continue
         ref_lines = ref_content.count("\n") + 1
         if ref_lines <= 100:
@@ -1121,6 +1312,20 @@ def _check_progressive_disclosure(body: str, skill_dir: Path, dim: DimensionScor
         dim.suggestions.append("Add ## Contents section to reference files over 100 lines")
 
 
+def _apply_band(
+    dim: DimensionScore, bands: list[tuple[float, float, str, str | None]], value: int
+) -> None:
+    """Apply the first band whose upper bound exceeds value."""
+    _, deduction, signal, suggestion = next(band for band in bands if value < band[0])
+    if deduction:
+        dim.score -= deduction
+        dim.signals_negative.append(signal.format(value))
+        if suggestion:
+            dim.suggestions.append(suggestion)
+    else:
+        dim.signals_positive.append(signal.format(value))
+
+
 def score_token_efficiency(content: str, body: str, skill_dir: Path) -> DimensionScore:
     """Score token efficiency: right-sized content, not too thin or bloated."""
     dim = DimensionScore(
@@ -1131,44 +1336,10 @@ def score_token_efficiency(content: str, body: str, skill_dir: Path) -> Dimensio
     words = word_count_prose(body)
 
     # Line count sweet spot: 50-500
-    if lines < 30:
-        dim.score -= 4.0
-        dim.signals_negative.append(f"Too short: {lines} lines")
-        dim.suggestions.append("Skill needs more content — add sections, examples, details")
-    elif lines < 50:
-        dim.score -= 2.0
-        dim.signals_negative.append(f"Thin content: {lines} lines")
-        dim.suggestions.append("Consider adding more examples or detail")
-    elif lines > 500:
-        dim.score -= 2.0
-        dim.signals_negative.append(f"Too long: {lines} lines (max 500)")
-        dim.suggestions.append("Move detailed content to references/ files")
-    elif lines > 450:
-        dim.score -= 1.0
-        dim.signals_negative.append(f"Approaching limit: {lines}/500 lines")
-    else:
-        dim.signals_positive.append(f"Good length: {lines} lines")
+    _apply_band(dim, LINE_COUNT_BANDS, lines)
 
     # Word count check (Anthropic guide: keep SKILL.md under 5,000 words)
-    if words < 100:
-        dim.score -= 2.0
-        dim.signals_negative.append(f"Very few prose words: {words}")
-    elif words > 5000:
-        dim.score -= 2.0
-        dim.signals_negative.append(
-            f"Exceeds Anthropic 5,000-word limit: {words} words — "
-            "causes slow responses and degraded quality"
-        )
-        dim.suggestions.append(
-            "Move detailed docs to references/ and link to them. "
-            "Keep SKILL.md under 5,000 words per Anthropic guidelines"
-        )
-    elif words > 4000:
-        dim.score -= 1.0
-        dim.signals_negative.append(f"High word count: {words} (limit: 5,000)")
-        dim.suggestions.append("Consider being more concise or offloading to references")
-    else:
-        dim.signals_positive.append(f"Word count: {words}")
+    _apply_band(dim, WORD_COUNT_BANDS, words)
 
     # Average sentence length
     sentence_count = count_sentences(body)
@@ -1202,8 +1373,8 @@ def score_token_efficiency(content: str, body: str, skill_dir: Path) -> Dimensio
             dim.suggestions.append(
                 "Offload detailed content to references/ files for progressive disclosure"
             )
-    elif refs_dir.is_dir():
-        ref_count = len(list(refs_dir.glob("**/*.md")))
+    else:
+        ref_count = count_markdown_files(refs_dir)
         if ref_count > 0:
             dim.signals_positive.append(f"Has {ref_count} reference file(s)")
 
@@ -1296,9 +1467,26 @@ def format_verbose(report: QualityReport) -> str:
     return "\n".join(lines)
 
 
-def format_json(report: QualityReport) -> str:
-    """Format report as JSON."""
-    data = {
+def format_batch_human(results: list[tuple[str, QualityReport]]) -> str:
+    """Format one summary line per skill for batch mode."""
+    width = max(20, *(len(name) for name, _ in results))
+    lines = ["", "Batch Quality Scores", "=" * 50, ""]
+    for name, report in results:
+        mark = "✓" if report.passed else "✗"
+        lines.append(
+            f"  {mark} {name:<{width}s} {report.overall_score:>4.1f}/10  → {report.recommendation}"
+        )
+    passed = sum(1 for _, report in results if report.passed)
+    lines.append("")
+    lines.append("-" * 50)
+    lines.append(f"  {passed}/{len(results)} passed (>= 7.0)")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def report_to_dict(report: QualityReport) -> dict:
+    """Convert a report to its JSON-serializable form."""
+    return {
         "overall_score": report.overall_score,
         "passed": report.passed,
         "recommendation": report.recommendation,
@@ -1314,7 +1502,166 @@ def format_json(report: QualityReport) -> str:
         },
         "suggestions": report.suggestions,
     }
-    return json.dumps(data, indent=2)
+
+
+def report_from_dict(data: dict) -> QualityReport:
+    """Rebuild a report from the form produced by report_to_dict."""
+    return QualityReport(
+        overall_score=data["overall_score"],
+        passed=data["passed"],
+        recommendation=data["recommendation"],
+        dimensions={
+            name: DimensionScore(
+                name=name,
+                score=dim["score"],
+                weight=dim["weight"],
+                signals_positive=dim["positive"],
+                signals_negative=dim["negative"],
+                suggestions=dim["suggestions"],
+            )
+            for name, dim in data["dimensions"].items()
+        },
+        suggestions=data["suggestions"],
+    )
+
+
+def format_json(report: QualityReport) -> str:
+    """Format report as JSON."""
+    return json.dumps(report_to_dict(report), indent=2)
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "score-skill"
+CACHE_SKIP_DIRS = {"__pycache__", "node_modules"}
+# Oldest entries beyond this count are evicted whenever a new report is saved
+CACHE_MAX_ENTRIES = 256
+
+
+def _linked_paths(body: str, skill_dir: Path) -> list[str]:
+    """Return links from body and from the files they point at, as the structure check sees them."""
+    links = extract_markdown_links(body)
+    nested: list[str] = []
+    for link in links:
+        try:
+            nested.extend(extract_markdown_links((skill_dir / link).read_text()))
+        except (OSError, UnicodeDecodeError):
+            continue
+    return links + nested
+
+
+def _hash_markdown_entries(digest: hashlib.blake2b, directory: str) -> None:
+    """Feed every entry count_markdown_files would count under directory into digest."""
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda e: e.name)
+    except OSError:
+        return
+    for entry in entries:
+        if entry.name.endswith(".md"):
+            try:
+                st = entry.stat(follow_symlinks=False)
+                digest.update(f"\0ref:{entry.path}:{st.st_mtime_ns}:{st.st_size}".encode())
+            except OSError:
+                digest.update(f"\0ref:{entry.path}:missing".encode())
+        if entry.is_dir(follow_symlinks=False):
+            _hash_markdown_entries(digest, entry.path)
+
+
+def cache_key(skill_dir: Path) -> str | None:
+    """Hash SKILL.md content plus the mtime/size of every other file in the skill.
+
+    The scorer's own stat and YAML loader are mixed in so rule or parser
+    changes invalidate old entries, as is the stat of every linked file, which
+    may live outside skill_dir, and of every entry count_markdown_files counts
+    under references/ (which may be a symlink).
+    Returns None when SKILL.md cannot be read (scored uncached).
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    loader = _YAML_LOADER.__name__ if _YAML_LOADER is not None else "regex"
+    try:
+        script = Path(__file__).stat()
+        digest.update(
+            f"{script.st_mtime_ns}:{script.st_size}:{loader}:{skill_dir.resolve()}".encode()
+        )
+        skill_md = (skill_dir / "SKILL.md").read_bytes()
+    except OSError:
+        return None
+    digest.update(skill_md)
+    for link in _linked_paths(skill_md.decode(errors="replace"), skill_dir):
+        try:
+            st = os.stat(skill_dir / link)
+            digest.update(f"\0link:{link}:{st.st_mtime_ns}:{st.st_size}".encode())
+        except OSError:
+            digest.update(f"\0link:{link}:missing".encode())
+    for root, dirnames, filenames in os.walk(skill_dir):
+        dirnames[:] = sorted(
+            d for d in dirnames if not d.startswith(".") and d not in CACHE_SKIP_DIRS
+        )
+        for filename in sorted(filenames):
+            path = os.path.join(root, filename)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rel = os.path.relpath(path, skill_dir)
+            digest.update(f"\0{rel}:{st.st_mtime_ns}:{st.st_size}".encode())
+    refs_dir = skill_dir / "references"
+    digest.update(f"\0references:{refs_dir.is_dir()}".encode())
+    _hash_markdown_entries(digest, str(refs_dir))
+    return digest.hexdigest()
+
+
+def load_cached_report(key: str) -> QualityReport | None:
+    """Return the cached report for key, or None if missing or unreadable."""
+    try:
+        return report_from_dict(json.loads((CACHE_DIR / f"{key}.json").read_bytes()))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_cached_report(key: str, report: QualityReport) -> None:
+    """Write report to the cache atomically; failures are ignored."""
+    path = CACHE_DIR / f"{key}.json"
+    tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+    data = json.dumps(report_to_dict(report))
+    try:
+        try:
+            tmp.write_text(data)
+        except FileNotFoundError:
+            # Only the first save creates the cache directory
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(data)
+        os.replace(tmp, path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+    prune_cache()
+
+
+def prune_cache(max_entries: int = CACHE_MAX_ENTRIES) -> None:
+    """Delete the least recently written cache entries beyond max_entries."""
+    entries: list[tuple[int, str]] = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                if entry.name.endswith(".json"):
+                    try:
+                        entries.append((entry.stat().st_mtime_ns, entry.path))
+                    except OSError:
+                        continue
+    except OSError:
+        return
+    if len(entries) <= max_entries:
+        return
+    entries.sort(reverse=True)
+    for _, path in entries[max_entries:]:
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
 
 
 # ---------------------------------------------------------------------------
@@ -1324,8 +1671,9 @@ def format_json(report: QualityReport) -> str:
 
 def score_skill(skill_dir: Path) -> QualityReport:
     """Score a skill directory and return quality report."""
-    skill_md = skill_dir / "SKILL.md"
-    if not skill_md.exists():
+    try:
+        content = (skill_dir / "SKILL.md").read_text()
+    except FileNotFoundError:
         dim = DimensionScore(name="spec_compliance", score=0.0, weight=1.0)
         dim.signals_negative.append("SKILL.md not found")
         return QualityReport(
@@ -1336,7 +1684,6 @@ def score_skill(skill_dir: Path) -> QualityReport:
             suggestions=["Create SKILL.md with valid frontmatter"],
         )
 
-    content = skill_md.read_text()
     frontmatter_str, body = extract_frontmatter(content)
     frontmatter = parse_frontmatter(frontmatter_str)
 
@@ -1354,22 +1701,79 @@ def score_skill(skill_dir: Path) -> QualityReport:
     return aggregate(dimensions)
 
 
+def score_skill_cached(skill_dir: Path, use_cache: bool = True) -> QualityReport:
+    """Score a skill, reusing a cached report when its files are unchanged."""
+    key = cache_key(skill_dir) if use_cache else None
+    report = load_cached_report(key) if key else None
+    if report is None:
+        report = score_skill(skill_dir)
+        if key:
+            save_cached_report(key, report)
+    return report
+
+
+def find_skill_dirs(parent: Path) -> list[Path]:
+    """Return immediate subdirectories of parent that contain a SKILL.md, sorted by name."""
+    with os.scandir(parent) as it:
+        return sorted(
+            Path(entry.path)
+            for entry in it
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, "SKILL.md"))
+        )
+
+
+def main_batch(parent: Path, json_output: bool, verbose: bool, use_cache: bool) -> int:
+    """Score every skill under parent and print one combined report."""
+    skill_dirs = find_skill_dirs(parent)
+    if not skill_dirs:
+        print(f"Error: No skill directories found in {parent}", file=sys.stderr)
+        return 2
+
+    if json_output:
+        # JSON Lines: one object per skill, written as soon as it is scored
+        all_passed = True
+        for d in skill_dirs:
+            report = score_skill_cached(d, use_cache)
+            all_passed = all_passed and report.passed
+            print(json.dumps({"skill": d.name, **report_to_dict(report)}), flush=True)
+        return 0 if all_passed else 1
+
+    results = [(d.name, score_skill_cached(d, use_cache)) for d in skill_dirs]
+
+    if verbose:
+        for name, report in results:
+            print(f"\n### {name}")
+            print(format_verbose(report))
+    print(format_batch_human(results))
+
+    return 0 if all(report.passed for _, report in results) else 1
+
+
 def main() -> int:
     args = sys.argv[1:]
 
     if not args or "-h" in args or "--help" in args:
-        print("Usage: score-skill.py <skill-directory> [--json] [--verbose]")
+        print("Usage: score-skill.py [--batch] <directory> [--json] [--verbose] [--no-cache]")
         return 2
 
     json_output = "--json" in args
     verbose = "--verbose" in args
-    skill_dir = Path([a for a in args if not a.startswith("-")][0])
+    use_cache = "--no-cache" not in args
+    batch = "--batch" in args
+    positional = [a for a in args if not a.startswith("-")]
+    if not positional:
+        print("Error: Missing directory argument", file=sys.stderr)
+        return 2
+    skill_dir = Path(positional[0])
 
     if not skill_dir.is_dir():
         print(f"Error: Not a directory: {skill_dir}", file=sys.stderr)
         return 2
 
-    report = score_skill(skill_dir)
+    if batch:
+        return main_batch(skill_dir, json_output, verbose, use_cache)
+
+    report = score_skill_cached(skill_dir, use_cache)
 
     if json_output:
         print(format_json(report))
@@ -20,6 +20,17 @@ import pytest
 SKILL_GENERATOR_ROOT = Path(__file__).parent.parent
 
 
+@pytest.fixture(autouse=True)
+def isolated_score_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Point score-skill.py's result cache at a per-test directory.
+
+    The scorer caches reports under $XDG_CACHE_HOME; without this, every
+    test (and every shell script that calls the scorer) would write into the
+    developer's real ~/.cache/score-skill.
+    """
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg-cache"))
+
+
 @pytest.fixture
 def temp_skill_dir() -> Generator[Path, None, None]:
     """Create a temporary directory for test skill files.
@@ -10,6 +10,7 @@ Tests cover:
 - Total skill limits (Feature #36)
 - JSON output (Feature #37)
 - Missing SKILL.md handling (Feature #38)
+- Fallback to estimation when tiktoken fails to import
 - Warning thresholds (Features #39-40)
 """
 
@@ -286,6 +287,37 @@ class TestMissingSkillMd:
         assert "SKILL.md" in str(data["warnings"]) or data["skill_md_tokens"] == 0
 
 
+class TestTiktokenFallback:
+    """Tests for falling back to estimation when tiktoken cannot be used."""
+
+    @pytest.mark.tokens
+    def test_broken_tiktoken_falls_back_to_estimate(
+        self,
+        temp_skill_dir: Path,
+        run_count_tokens,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """A tiktoken package that fails to import is treated as unavailable."""
+        broken = temp_skill_dir / "site" / "tiktoken"
+        broken.mkdir(parents=True)
+        (broken / "__init__.py").write_text("raise ImportError('missing compiled extension')\n")
+        monkeypatch.setenv("PYTHONPATH", str(broken.parent))
+
+        skill_dir = temp_skill_dir / "skill"
+        skill_dir.mkdir()
+        create_skill_md(
+            skill_dir,
+            name="fallback-skill",
+            description="A skill for testing the tiktoken fallback.",
+        )
+
+        result = run_count_tokens(skill_dir, json_output=True)
+
+        assert result.returncode == 0, f"Expected exit 0. stderr: {result.stderr}"
+        data = json.loads(result.stdout)
+        assert data["method"] == "estimate"
+
+
 class TestWarningThresholds:
     """Tests for warning threshold configuration."""
 
@@ -6,6 +6,7 @@ Tests each dimension and overall scoring behavior.
 from __future__ import annotations
 
 import json
+import os
 import subprocess
 from pathlib import Path
 
@@ -139,6 +140,12 @@ class TestSpecCompliance:
         data = get_score(temp_skill_dir)
         assert data["dimensions"]["spec_compliance"]["score"] <= 7.0
 
+    def test_non_mapping_frontmatter_scores_low(self, temp_skill_dir: Path) -> None:
+        (temp_skill_dir / "SKILL.md").write_text("---\njust a string\n---\n\n# Test\n")
+        result = run_scorer(temp_skill_dir)
+        data = json.loads(result.stdout)
+        assert data["dimensions"]["spec_compliance"]["score"] < 7.0
+
     def test_first_person_description_penalized(self, temp_skill_dir: Path) -> None:
         content = (
             "---\nname: bad-desc\n"
@@ -403,6 +410,20 @@ class TestExampleQuality:
         examples = data["dimensions"]["example_quality"]
         assert not any("magic" in s.lower() for s in examples["negative"])
 
+    def test_invalid_json_and_yaml_blocks_penalized(self, temp_skill_dir: Path) -> None:
+        """Malformed json/yaml examples are reported instead of crashing the scorer."""
+        content = (
+            "---\nname: bad-blocks\n"
+            "description: A skill with broken data examples.\n---\n\n"
+            "# Bad Blocks\n\n## Overview\n\nData skill.\n\n"
+            '## Examples\n\n```json\n{"key": \n```\n\n```yaml\nitems: [a, b\n```\n'
+        )
+        (temp_skill_dir / "SKILL.md").write_text(content)
+        data = get_score(temp_skill_dir)
+        examples = data["dimensions"]["example_quality"]
+        assert "Invalid json syntax in code block" in examples["negative"]
+        assert "Invalid yaml syntax in code block" in examples["negative"]
+
 
 class TestStructure:
     def test_missing_overview_scores_low(self, temp_skill_dir: Path) -> None:
@@ -551,6 +572,106 @@ class TestTokenEfficiency:
         assert not any("no references" in s.lower() for s in negatives)
 
 
+class TestResultCache:
+    @staticmethod
+    def _run(skill_dir: Path, cache_home: Path, *extra: str) -> subprocess.CompletedProcess:
+        env = {**os.environ, "XDG_CACHE_HOME": str(cache_home)}
+        cmd = ["python3", str(SCRIPT), str(skill_dir), "--json", *extra]
+        return subprocess.run(cmd, capture_output=True, text=True, timeout=10, env=env)
+
+    def test_report_cached_and_invalidated_on_edit(self, temp_skill_dir: Path) -> None:
+        skill_dir = temp_skill_dir / "skill"
+        skill_dir.mkdir()
+        cache_home = temp_skill_dir / "cache"
+        (skill_dir / "SKILL.md").write_text(VALID_SKILL)
+
+        first = self._run(skill_dir, cache_home)
+        assert list((cache_home / "score-skill").glob("*.json"))
+        assert self._run(skill_dir, cache_home).stdout == first.stdout
+
+        (skill_dir / "SKILL.md").write_text("no frontmatter here\n")
+        data = json.loads(self._run(skill_dir, cache_home).stdout)
+        assert data["passed"] is False
+
+    def test_cache_invalidated_when_linked_file_outside_skill_changes(
+        self, temp_skill_dir: Path
+    ) -> None:
+        skill_dir = temp_skill_dir / "skill"
+        skill_dir.mkdir()
+        shared = temp_skill_dir / "shared"
+        shared.mkdir()
+        cache_home = temp_skill_dir / "cache"
+        (shared / "guide.md").write_text("# Guide\n\nShort.\n")
+        (skill_dir / "SKILL.md").write_text(VALID_SKILL + "\nSee [guide](../shared/guide.md).\n")
+
+        assert "without TOC" not in self._run(skill_dir, cache_home).stdout
+        (shared / "guide.md").write_text("# Guide\n\n" + "line\n" * 200)
+        assert "without TOC" in self._run(skill_dir, cache_home).stdout
+
+    def test_cache_invalidated_when_symlinked_references_change(self, temp_skill_dir: Path) -> None:
+        skill_dir = temp_skill_dir / "skill"
+        skill_dir.mkdir()
+        shared = temp_skill_dir / "shared-refs"
+        shared.mkdir()
+        cache_home = temp_skill_dir / "cache"
+        (skill_dir / "SKILL.md").write_text(VALID_SKILL)
+        (skill_dir / "references").symlink_to(shared, target_is_directory=True)
+
+        assert "reference file" not in self._run(skill_dir, cache_home).stdout
+        (shared / "guide.md").write_text("# Guide\n")
+        assert "Has 1 reference file(s)" in self._run(skill_dir, cache_home).stdout
+
+    def test_cache_evicts_oldest_entries(self, temp_skill_dir: Path) -> None:
+        cache_home = temp_skill_dir / "cache"
+        cache_dir = cache_home / "score-skill"
+        cache_dir.mkdir(parents=True)
+        for i in range(256):
+            entry = cache_dir / f"stale{i:03d}.json"
+            entry.write_text("{}")
+            os.utime(entry, ns=(i + 1, i + 1))
+        skill_dir = temp_skill_dir / "skill"
+        skill_dir.mkdir()
+        (skill_dir / "SKILL.md").write_text(VALID_SKILL)
+
+        self._run(skill_dir, cache_home)
+        names = {p.name for p in cache_dir.glob("*.json")}
+        assert len(names) == 256
+        assert "stale000.json" not in names
+        assert "stale255.json" in names
+
+    def test_no_cache_flag_skips_cache(self, temp_skill_dir: Path) -> None:
+        skill_dir = temp_skill_dir / "skill"
+        skill_dir.mkdir()
+        cache_home = temp_skill_dir / "cache"
+        (skill_dir / "SKILL.md").write_text(VALID_SKILL)
+
+        result = self._run(skill_dir, cache_home, "--no-cache")
+        assert result.returncode == 0
+        assert not (cache_home / "score-skill").exists()
+
+
+class TestBatchMode:
+    def test_batch_scores_each_skill(self, temp_skill_dir: Path) -> None:
+        (temp_skill_dir / "good").mkdir()
+        (temp_skill_dir / "good" / "SKILL.md").write_text(VALID_SKILL)
+        (temp_skill_dir / "bad").mkdir()
+        (temp_skill_dir / "bad" / "SKILL.md").write_text("no frontmatter here\n")
+        (temp_skill_dir / "not-a-skill").mkdir()
+
+        cmd = ["python3", str(SCRIPT), "--batch", str(temp_skill_dir), "--json", "--no-cache"]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        reports = [json.loads(line) for line in result.stdout.splitlines()]
+        assert [r["skill"] for r in reports] == ["bad", "good"]
+        assert reports[0]["passed"] is False
+        assert reports[1]["passed"] is True
+        assert result.returncode == 1
+
+    def test_batch_without_skills_is_usage_error(self, temp_skill_dir: Path) -> None:
+        cmd = ["python3", str(SCRIPT), "--batch", str(temp_skill_dir), "--no-cache"]
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        assert result.returncode == 2
+
+
 class TestAdvancedPatternBonuses:
     """Tests for bonus signals rewarding advanced skill patterns."""
 